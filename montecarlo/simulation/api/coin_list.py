@@ -0,0 +1,88 @@
+"""
+CoinGecko Coin List Module
+
+This module keeps the set of cryptocurrency ids known to the CoinGecko API in
+memory, so unknown ids can be rejected before any price data is requested.
+
+"""
+import logging
+import os
+import threading
+import time
+import orjson
+import requests
+from .session import SESSION
+
+COIN_LIST_URL = "https://api.coingecko.com/api/v3/coins/list"
+REFRESH_INTERVAL = 24 * 60 * 60  # Refresh the coin list daily
+RETRY_INTERVAL = 5 * 60  # Retry sooner when a refresh fails
+
+_coin_ids = None
+_refresh_pid = None
+_refresh_lock = threading.Lock()
+
+
+def get_coin_ids():
+    """
+    Returns the cryptocurrency ids known to CoinGecko.
+
+    Returns:
+        frozenset: The known coin ids, or None if the list has not been loaded yet.
+    """
+    return _coin_ids
+
+
+def refresh_coin_ids() -> bool:
+    """
+    Fetches the list of coin ids from the CoinGecko API and replaces the cached set.
+
+    Returns:
+        bool: True if the list was refreshed, False if the request failed. The
+            previously loaded ids are kept on failure.
+    """
+    global _coin_ids
+    logging.info("Executing refresh_coin_ids command ...")
+    try:
+        # Reuse the pooled CoinGecko session shared with the price requests
+        response = SESSION.get(COIN_LIST_URL, timeout=10)
+        if response.status_code != 200:
+            logging.warning(
+                "Failed to execute refresh_coin_ids. Status code: %s",
+                response.status_code,
+            )
+            return False
+        _coin_ids = frozenset(entry["id"] for entry in orjson.loads(response.content))
+    except requests.exceptions.RequestException as e:
+        logging.error("Error during API request: %s", str(e))
+        return False
+    except (KeyError, TypeError, ValueError) as e:
+        logging.error("Error while processing data: %s", str(e))
+        return False
+    logging.info(
+        "Successfully executed refresh_coin_ids command, %s coin ids loaded.",
+        len(_coin_ids),
+    )
+    return True
+
+
+def _refresh_periodically():
+    while True:
+        refreshed = refresh_coin_ids()
+        time.sleep(REFRESH_INTERVAL if refreshed else RETRY_INTERVAL)
+
+
+def start_background_refresh():
+    """
+    Starts a daemon thread that loads the coin list and refreshes it daily.
+
+    Loading happens in the background so the caller is never blocked on the
+    CoinGecko API. The thread is started once per process: threads do not survive
+    a fork, so a worker forked after the parent started it starts its own.
+    """
+    global _refresh_pid
+    with _refresh_lock:
+        if _refresh_pid != os.getpid():
+            _refresh_pid = os.getpid()
+            threading.Thread(
+                target=_refresh_periodically, name="coin-list-refresh", daemon=True
+            ).start()
@@ -5,16 +5,41 @@ This module defines the `CoinGeckoMonteCarloSimulation` class, which performs
 Monte Carlo simulations for predicting the future value of a cryptocurrency investment.
 
 """
-from datetime import datetime
+from functools import cached_property
+import io
 import logging
+import time
+import orjson
 import requests
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import matplotlib
+
+# Select the Agg backend before pyplot is imported to avoid GUI-related issues
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
 import mpld3
+from .session import SESSION
+
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, the NumPy path is used without it
+    _NUMBA_AVAILABLE = False
+
+# Horizons from which full-path draws are done in float32 to halve memory traffic
+_FLOAT32_MIN_HORIZON = 1024
+
+# Upper bound on the number of bars in the simulation chart
+_MAX_BARS = 50
 
-matplotlib.use("Agg")  # Use Agg backend to avoid GUI-related issues
+# Process-wide cache of CoinGecko price data, keyed by (coin_id, years) and holding
+# (time.monotonic() of the fetch, price array). Entries expire after the TTL.
+_PRICE_CACHE: dict[tuple[str, int], tuple[float, np.ndarray]] = {}
+_PRICE_CACHE_TTL = 300
 
 logging.basicConfig(
     filename="finance.log",
@@ -22,6 +47,28 @@ logging.basicConfig(
     format="%(asctime)s _ %(levelname)s _ %(name)s _ %(message)s",
 )
 
+if _NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_kernel(mu, sigma, horizon, num_simulations, principal_amount, seed):
+        """
+        Simulates every path day by day, one path per parallel iteration.
+
+        Each path reseeds the thread's generator with `seed + i`, so results do not
+        depend on how iterations are scheduled across threads.
+
+        Returns:
+            np.ndarray: Future values, one per simulation.
+        """
+        out = np.empty(num_simulations)
+        for i in prange(num_simulations):
+            np.random.seed(seed + i)
+            total = 0.0
+            for _ in range(horizon):
+                total += np.random.normal(mu, sigma)
+            out[i] = principal_amount * np.exp(total)
+        return out
+
 
 class CoinGeckoMonteCarloSimulation:
     """
@@ -36,18 +83,30 @@ class CoinGeckoMonteCarloSimulation:
         principal_amount (float): The initial principal amount of the investment.
         investment_horizon (int): The investment horizon in days.
         num_simulations (int): The number of simulations to perform.
+        interactive (bool): Render graphs with mpld3 instead of static SVG.
+        seed (int | None): Seed for the random number generator, for reproducible runs.
+        price_history (tuple | None): Lazily fetched (timestamps, prices), or None if
+            the fetch failed.
+        log_returns (np.ndarray | None): Lazily computed log returns of the prices.
+        simulated_values (np.ndarray): Lazily computed Monte Carlo future values.
+        price_data_temporarily_unavailable (bool): True if the last price request
+            failed for a reason worth retrying (timeout, connection error, rate limit
+            or server error) rather than because the coin does not exist.
 
     Methods:
+        prepare() -> bool:
+            Fetches the price history once and derives the log returns for later steps.
+
         fetch_price_data(coin_id, years, return_timestamps=False):
             Fetches historical cryptocurrency price data from CoinGecko API.
 
-        calculate_log_returns(prices) -> pd.Series:
+        calculate_log_returns(prices) -> np.ndarray:
             Calculates logarithmic returns from a list of prices.
 
-        monte_carlo_simulation(log_returns, principal_amount, investment_horizon) -> list:
+        monte_carlo_simulation(log_returns, principal_amount, investment_horizon) -> np.ndarray:
             Performs Monte Carlo simulations for future value prediction of a cryptocurrency investment.
 
-        run_simulation() -> list:
+        run_simulation() -> np.ndarray:
             Runs simulations and returns the results.
 
         visualize_simulation() -> str:
@@ -65,12 +124,98 @@ class CoinGeckoMonteCarloSimulation:
         principal_amount: float,
         investment_horizon: int,
         num_simulations: int,
+        interactive: bool = False,
+        seed: int | None = None,
     ):
         self.coin_id = coin_id.lower()
         self.years = years_of_price_data_to_collect_starting_from_current_year
         self.principal_amount = principal_amount
         self.investment_horizon = investment_horizon
         self.num_simulations = num_simulations
+        self.interactive = interactive
+        self.seed = seed
+        self.price_data_temporarily_unavailable = False
+        # SFC64 generates normals faster than the default PCG64 bit generator
+        self._rng = np.random.Generator(np.random.SFC64(seed))
+
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Initializes the Agg renderer and the font cache ahead of the first request.
+
+        The first figure drawn in a process pays for backend setup and font lookup;
+        calling this at application startup moves that cost out of the first view.
+        The numba kernel is left to compile on its first call, since only
+        `simulate_paths=True` uses it.
+        """
+        fig, ax = plt.subplots()
+        ax.set_title("warmup")
+        fig.canvas.draw()
+        plt.close(fig)
+
+    @cached_property
+    def price_history(self):
+        """
+        Timestamps and prices of the cryptocurrency, fetched at most once per instance.
+
+        Returns:
+            tuple: (timestamps, prices), or None if the price data could not be fetched.
+        """
+        return self.fetch_price_data(self.coin_id, self.years, return_timestamps=True)
+
+    @cached_property
+    def log_returns(self):
+        """
+        Logarithmic returns of the fetched prices, computed at most once per instance.
+
+        Returns:
+            np.ndarray: Logarithmic returns, or None if the price data could not be fetched.
+        """
+        if self.price_history is None:
+            return None
+        return self.calculate_log_returns(self.price_history[1])
+
+    @cached_property
+    def simulated_values(self) -> np.ndarray:
+        """
+        Future values of the Monte Carlo simulations, computed at most once per instance.
+
+        Returns:
+            np.ndarray: Future values, empty if the price data could not be fetched.
+        """
+        if self.log_returns is None:
+            return np.empty(0)
+        return self.monte_carlo_simulation(
+            self.log_returns, self.principal_amount, self.investment_horizon
+        )
+
+    def prepare(self) -> bool:
+        """
+        Fetches the price history once and derives the log returns from it.
+
+        `run_simulation` and `visualize_history_graph` read the same cached data, so
+        calling this first guarantees a single fetch per view render.
+
+        Returns:
+            bool: True if the price data was retrieved, False otherwise. On failure,
+                `price_data_temporarily_unavailable` tells a transient CoinGecko
+                failure apart from an unknown coin.
+        """
+        logging.info(
+            "CoinGeckoMonteCarloSimulation executing prepare command for crypto %s ...",
+            self.coin_id,
+        )
+        if self.log_returns is None:
+            logging.warning(
+                "CoinGeckoMonteCarloSimulation failed to execute prepare for crypto %s.",
+                self.coin_id,
+            )
+            return False
+        logging.info(
+            "CoinGeckoMonteCarloSimulation successfully executed prepare command for crypto %s.",
+            self.coin_id,
+        )
+        return True
 
     def fetch_price_data(self, coin_id, years, return_timestamps: bool = False):
         """
@@ -79,62 +224,111 @@ class CoinGeckoMonteCarloSimulation:
         Args:
             coin_id (str): The symbol or identifier of the cryptocurrency.
             years (int): The number of years of historical data to consider.
+            return_timestamps (bool): Also return the timestamp of every price.
 
         Returns:
-            list: A list of historical prices for the specified cryptocurrency.
+            np.ndarray: Historical prices for the specified cryptocurrency, or a
+                (timestamps, prices) tuple when `return_timestamps` is True.
                 Returns None if there are errors during data retrieval or processing.
         """
         logging.info(
             "CoinGeckoMonteCarloSimulation executing fetch_price_data command for crypto %s ...",
             self.coin_id,
         )
+        now = time.monotonic()
+        cached = _PRICE_CACHE.get((coin_id, years))
+        if cached is not None and now - cached[0] < _PRICE_CACHE_TTL:
+            price_data = cached[1]
+            logging.info(
+                "CoinGeckoMonteCarloSimulation reusing cached price data for crypto %s.",
+                self.coin_id,
+            )
+        else:
+            price_data = self._request_price_data(coin_id, years)
+            if price_data is None:
+                return None
+            # The array is shared between instances, so keep it read-only
+            price_data.flags.writeable = False
+            for key, (fetched_at, _) in list(_PRICE_CACHE.items()):
+                if now - fetched_at >= _PRICE_CACHE_TTL:
+                    _PRICE_CACHE.pop(key, None)
+            _PRICE_CACHE[(coin_id, years)] = (now, price_data)
+
+        prices = price_data[:, 1]
+        if not return_timestamps:
+            logging.info(
+                "CoinGeckoMonteCarloSimulation successfully executed fetch_price_data command for crypto %s, returning prices.",
+                self.coin_id,
+            )
+            return prices
+
+        # Only convert timestamps when they are actually requested; matplotlib
+        # plots the resulting DatetimeIndex directly
+        timestamps_in_milliseconds = price_data[:, 0].astype("int64", copy=False)
+        timestamps = pd.to_datetime(timestamps_in_milliseconds, unit="ms")
+        logging.info(
+            "CoinGeckoMonteCarloSimulation successfully executed fetch_price_data command for crypto %s, returning timestamps and prices.",
+            self.coin_id,
+        )
+        return timestamps, prices
+
+    def _request_price_data(self, coin_id, years):
+        """
+        Requests the market chart of a cryptocurrency from the CoinGecko API.
+
+        Returns:
+            np.ndarray: Array of shape (n, 2) holding the millisecond timestamp and
+                the price of every data point. Returns None on errors, setting
+                `price_data_temporarily_unavailable` when the error is transient.
+        """
+        self.price_data_temporarily_unavailable = False
         try:
             # Calculate the number of data points based on the interval
             days = years * 365
 
-            # Fetch historical price data from the CoinGecko API
-            url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart?vs_currency=usd&days={days}"
-            response = requests.get(url, timeout=10)
+            # Fetch historical price data from the CoinGecko API. The daily interval
+            # is explicit because CoinGecko otherwise returns hourly points for
+            # ranges up to 90 days, making the number of points depend on `years`.
+            url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart?vs_currency=usd&days={days}&interval=daily"
+            response = SESSION.get(url, timeout=5)
 
             if response.status_code == 200:
-                data = response.json()
-
-                # Extract prices from the response
-                prices = [entry[1] for entry in data["prices"]]
-                timestamp_in_milliseconds = [e[0] for e in data["prices"]]
-                timestamps = [
-                    datetime.fromtimestamp(ts / 1000)
-                    for ts in timestamp_in_milliseconds
-                ]
-                if not return_timestamps:
-                    logging.info(
-                        "CoinGeckoMonteCarloSimulation successfully executed fetch_price_data command for crypto %s, returning prices.",
-                        self.coin_id,
-                    )
-                    return prices
-                else:
-                    logging.info(
-                        "CoinGeckoMonteCarloSimulation successfully executed fetch_price_data command for crypto %s, returning timestamps and prices.",
-                        self.coin_id,
-                    )
-                    return timestamps, prices
+                # Keep only the prices; market caps and volumes are released as
+                # soon as the decoded payload goes out of scope
+                price_pairs = orjson.loads(response.content)["prices"]
+
+                # Parse the [timestamp, price] pairs into a single float64 array
+                price_data = np.asarray(price_pairs, dtype=np.float64).reshape(-1, 2)
+                logging.info(
+                    "CoinGeckoMonteCarloSimulation requested %s days of prices for crypto %s, received %s data points.",
+                    days,
+                    coin_id,
+                    len(price_data),
+                )
+                return price_data
             else:
                 logging.warning(
                     "CoinGeckoMonteCarloSimulation failed to execute fetch_price_data. Status code: %s",
                     response.status_code,
                 )
+                # Rate limiting and server errors say nothing about the coin itself
+                self.price_data_temporarily_unavailable = (
+                    response.status_code == 429 or response.status_code >= 500
+                )
                 return None
         except requests.Timeout:
             logging.error("Request timed out. Please try again.")
+            self.price_data_temporarily_unavailable = True
             return None
         except requests.exceptions.RequestException as e:
             logging.error("Error during API request: %s", str(e))
+            self.price_data_temporarily_unavailable = True
             return None
         except (KeyError, ValueError) as e:
             logging.error("Error while processing data: %s", str(e))
             return None
 
-    def calculate_log_returns(self, prices) -> pd.Series:
+    def calculate_log_returns(self, prices) -> np.ndarray:
         """
         Calculates logarithmic returns from a list of prices.
 
@@ -142,66 +336,124 @@ class CoinGeckoMonteCarloSimulation:
             prices (list): List of historical prices.
 
         Returns:
-            pd.Series: Logarithmic returns.
+            np.ndarray: Logarithmic returns, one fewer than the number of prices.
 
         """
         logging.info(
             "CoinGeckoMonteCarloSimulation executing calculate_log_returns command ..."
         )
-        price_df = pd.Series(prices)
-        log_returns = np.log(price_df / price_df.shift(1))
+        price_array = np.asarray(prices, dtype=np.float64)
+        log_returns = np.diff(np.log(price_array))
         logging.info(
             "CoinGeckoMonteCarloSimulation successfully executed calculate_log_returns command."
         )
-        return log_returns.dropna()
+        return log_returns
 
     def monte_carlo_simulation(
-        self, log_returns, principal_amount, investment_horizon
-    ) -> list:
+        self, log_returns, principal_amount, investment_horizon, simulate_paths=False
+    ) -> np.ndarray:
         """
         Performs Monte Carlo simulations for future value prediction of a cryptocurrency investment.
 
         Args:
-            log_returns (pd.Series): Logarithmic returns.
+            log_returns (np.ndarray): Logarithmic returns.
             principal_amount (float): The initial principal amount of the investment.
             investment_horizon (int): The investment horizon in days.
+            simulate_paths (bool): Draw every daily log-return of every path instead
+                of sampling the terminal values directly.
 
         Returns:
-            list: List of future values from Monte Carlo simulations
+            np.ndarray: Future values from Monte Carlo simulations, one per simulation.
         """
         logging.info(
             "CoinGeckoMonteCarloSimulation executing monte_carlo_simulation command ..."
         )
-        returns = []
-        for _ in range(self.num_simulations):
-            random_log_returns = np.random.normal(
-                log_returns.mean(), log_returns.std(), size=investment_horizon
+        # Loop-invariant statistics, reduced once and passed on as plain floats
+        mu = float(log_returns.mean())
+        sigma = float(log_returns.std(ddof=0))
+        if simulate_paths:
+            returns = self._path_terminal_values(
+                mu, sigma, principal_amount, investment_horizon
+            )
+        else:
+            returns = self._terminal_values(
+                mu, sigma, principal_amount, investment_horizon
             )
-            future_values = np.exp(np.cumsum(random_log_returns))
-            final_value = principal_amount * future_values[-1]
-            returns.append(final_value)
         logging.info(
             "CoinGeckoMonteCarloSimulation successfully executed monte_carlo_simulation command."
         )
         return returns
 
-    def run_simulation(self) -> list:
+    def _terminal_values(
+        self, mu, sigma, principal_amount, investment_horizon
+    ) -> np.ndarray:
+        """
+        Samples terminal values directly from the distribution of the summed log-returns.
+
+        The sum of `investment_horizon` i.i.d. N(mu, sigma) draws is itself normal
+        with mean H * mu and standard deviation sqrt(H) * sigma, so a single draw
+        per simulation is enough.
+
+        Returns:
+            np.ndarray: Future values, one per simulation.
+        """
+        z = self._rng.standard_normal(self.num_simulations)
+        terminal_log_returns = (
+            investment_horizon * mu + np.sqrt(investment_horizon) * sigma * z
+        )
+        return principal_amount * np.exp(terminal_log_returns)
+
+    def _path_terminal_values(
+        self, mu, sigma, principal_amount, investment_horizon
+    ) -> np.ndarray:
+        """
+        Simulates every daily log-return of every path and returns the terminal values.
+
+        Returns:
+            np.ndarray: Future values, one per simulation.
+        """
+        if _NUMBA_AVAILABLE:
+            return _mc_kernel(
+                mu,
+                sigma,
+                int(investment_horizon),
+                int(self.num_simulations),
+                float(principal_amount),
+                int(self._rng.integers(2**31)),
+            )
+
+        # Draw every path at once: one row per simulation, one column per day
+        shape = (self.num_simulations, investment_horizon)
+        # Long horizons are bandwidth bound; single precision is plenty for a
+        # terminal value and is widened back before exponentiating
+        if investment_horizon >= _FLOAT32_MIN_HORIZON:
+            dtype = np.float32
+        else:
+            dtype = np.float64
+        random_log_returns = self._rng.standard_normal(shape, dtype=dtype)
+        # Scale in place to avoid two more (num_simulations, horizon) temporaries
+        random_log_returns *= dtype(sigma)
+        random_log_returns += dtype(mu)
+        # Only the terminal value is used, so sum the log-returns instead of
+        # building the full cumulative path
+        terminal_log_returns = random_log_returns.sum(axis=1, dtype=dtype).astype(
+            np.float64, copy=False
+        )
+        return principal_amount * np.exp(terminal_log_returns)
+
+    def run_simulation(self) -> np.ndarray:
         """
         Runs simulations and returns the results.
 
         Returns:
-            list: List of future values from Monte Carlo simulations.
+            np.ndarray: Future values from Monte Carlo simulations.
         """
         logging.info(
             "CoinGeckoMonteCarloSimulation executing run_simulation command for crypto %s...",
             self.coin_id,
         )
-        prices = self.fetch_price_data(self.coin_id, self.years)
-        if prices is not None:
-            log_returns = self.calculate_log_returns(prices)
-            total_average_simulations = self.monte_carlo_simulation(
-                log_returns, self.principal_amount, self.investment_horizon
-            )
+        if self.log_returns is not None:
+            total_average_simulations = self.simulated_values
             logging.info(
                 "CoinGeckoMonteCarloSimulation successfully executed run_simulation command for crypto %s.",
                 self.coin_id,
@@ -210,10 +462,10 @@ class CoinGeckoMonteCarloSimulation:
 
         else:
             logging.warning(
-                "CoinGeckoMonteCarloSimulation failed to execute run_simulation for crypto %s. Will return empty list.",
+                "CoinGeckoMonteCarloSimulation failed to execute run_simulation for crypto %s. Will return empty array.",
                 self.coin_id,
             )
-            return []
+            return np.empty(0)
 
     def visualize_simulation(self) -> str:
         """
@@ -226,41 +478,17 @@ class CoinGeckoMonteCarloSimulation:
             "CoinGeckoMonteCarloSimulation executing visualize_simulation command for crypto %s...",
             self.coin_id,
         )
-        average_future_values = self.run_simulation()
-        simulation_number = list(range(1, len(average_future_values) + 1))
-
-        average_future_value_df = pd.DataFrame(
-            {
-                "Simulation Number": simulation_number,
-                "Average Future Value": average_future_values,
-            }
-        )
-        if len(simulation_number) >= 50:
-            # Create a figure with a single subplot
-            fig, ax = plt.subplots(figsize=(14, len(simulation_number) / 4))
-        else:
-            fig, ax = plt.subplots(figsize=(14, 12))
+        average_future_values = np.asarray(self.run_simulation(), dtype=np.float64)
 
-        # Plot the bar chart
-        average_future_value_df.plot.barh(
-            y="Average Future Value", x="Simulation Number", legend=False, ax=ax
+        simulations_above_principal_amount = np.count_nonzero(
+            average_future_values >= self.principal_amount
         )
-        ax.set_xlabel("Average Future Value")
-        ax.set_ylabel("Simulation Number")
-        ax.grid(True)
-
-        below_condition = (
-            average_future_value_df["Average Future Value"] >= self.principal_amount
-        )
-        simulations_above_principal_amount = average_future_value_df[below_condition][
-            "Average Future Value"
-        ].count()
 
         # Display additional information as text
         tab_info = (
-            f"Minimum of all Monte Carlo Simulations: {average_future_value_df['Average Future Value'].min():.2f}$",
-            f"Maximum of all Monte Carlo Simulations: {average_future_value_df['Average Future Value'].max():.2f}$",
-            f"Average of all Monte Carlo Simulations: {np.mean(average_future_value_df['Average Future Value']):.2f}$",
+            f"Minimum of all Monte Carlo Simulations: {average_future_values.min():.2f}$",
+            f"Maximum of all Monte Carlo Simulations: {average_future_values.max():.2f}$",
+            f"Average of all Monte Carlo Simulations: {average_future_values.mean():.2f}$",
             f"Simulations above principal amount: {simulations_above_principal_amount}",
             f"Years of Price Data Collected: {self.years} years",
             f"Number of Simulations: {self.num_simulations}",
@@ -269,21 +497,52 @@ class CoinGeckoMonteCarloSimulation:
             f"Cryptocurrency: {self.coin_id.capitalize()}",
         )
 
-        # Add text annotations to the top of the plot
-        spacing = 0.014  # Adjust this value as needed
-        for i, line in enumerate(tab_info):
-            ax.annotate(
-                line,
-                xy=(0.5, 1.02 + spacing * (i + 1)),
-                xycoords="axes fraction",
-                ha="center",
-                va="center",
-                fontsize=14,
+        # One bar per simulation is unreadable for large runs, so simulations are
+        # ranked by future value and grouped into at most _MAX_BARS quantile bars
+        # showing their mean. Simulations are i.i.d., so grouping them unsorted
+        # would average every bar towards the overall mean.
+        num_bars = min(average_future_values.size, _MAX_BARS)
+        bucketed = num_bars < average_future_values.size
+        bar_edges = np.linspace(0, average_future_values.size, num_bars + 1).astype(int)
+        bar_starts, bar_sizes = bar_edges[:-1], np.diff(bar_edges)
+        if bucketed:
+            bar_values = (
+                np.add.reduceat(np.sort(average_future_values), bar_starts) / bar_sizes
             )
+        else:
+            bar_values = average_future_values
 
-        # Convert the Matplotlib figure to HTML using mpld3
-        graph_html = mpld3.fig_to_html(fig)
-        plt.close(fig)
+        # Create a figure with a single subplot
+        fig, ax = plt.subplots(figsize=(14, max(12, num_bars / 4)))
+        try:
+            # Plot the bar chart; each bucketed bar spans the ranks it covers
+            if not bucketed:
+                ax.barh(bar_starts + 1, bar_values, height=0.5)
+            else:
+                ax.barh(
+                    bar_starts + 0.5,
+                    bar_values,
+                    height=bar_sizes,
+                    align="edge",
+                    edgecolor="white",
+                )
+            ax.set_xlabel("Average Future Value")
+            if bucketed:
+                ax.set_ylabel("Simulation Rank (lowest to highest future value)")
+            else:
+                ax.set_ylabel("Simulation Number")
+            # Simulation numbers and ranks are whole; keep the axis from ticking 2.5
+            ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+            ax.grid(True)
+
+            # Add the text above the plot; lines are stacked bottom-up, so the
+            # first entry sits closest to the axes
+            self._draw_text_rows(ax, list(reversed(tab_info)), fontsize=14)
+
+            graph_html = self._figure_to_html(fig)
+        finally:
+            # Close the figure even if rendering fails so pyplot does not keep it
+            plt.close(fig)
         logging.info(
             "CoinGeckoMonteCarloSimulation successfully executed visualize_simulation command for crypto %s.",
             self.coin_id,
@@ -301,18 +560,9 @@ class CoinGeckoMonteCarloSimulation:
             "CoinGeckoMonteCarloSimulation executing visualize_history_graph command for crypto %s...",
             self.coin_id,
         )
-        timestamps, prices = self.fetch_price_data(
-            coin_id=self.coin_id, years=self.years, return_timestamps=True
-        )
+        timestamps, prices = self.price_history
         history_graph = pd.DataFrame({"Timestamps": timestamps, "Prices": prices})
 
-        # Plotting using Matplotlib
-        fig, ax = plt.subplots(figsize=(14, 11))
-        ax.plot(history_graph["Timestamps"], history_graph["Prices"])
-        ax.set_xlabel("Timestamps")
-        ax.set_ylabel("Prices in $")
-        ax.grid(True)
-
         min_price = history_graph["Prices"].min()
         max_price = history_graph["Prices"].max()
         average_price = history_graph["Prices"].mean()
@@ -327,7 +577,7 @@ class CoinGeckoMonteCarloSimulation:
         # Use the index to get the corresponding timestamp
         timestamp_max_price = history_graph.loc[max_price_index, "Timestamps"]
         timestamp_min_price = history_graph.loc[min_price_index, "Timestamps"]
-    
+
         # Add extra information at the top of the graph
         extra_info = [
             f"Cryptocurrency: {self.coin_id.capitalize()}",
@@ -340,31 +590,79 @@ class CoinGeckoMonteCarloSimulation:
             f"Average price per {self.years} years: {average_price:.2f}$",
         ]
 
-        # Set the y-coordinate for the text
-        y_coord = 1.15
-
-        # Iterate over each line of text and place it on a different row
-        for line in extra_info:
-            ax.text(
-                0.5,
-                y_coord,
-                line,
-                transform=ax.transAxes,
-                ha="center",
-                va="center",
-                fontsize=14,
-            )
-            y_coord -= 0.017  # Adjust this value to control the spacing between rows
+        # Plotting using Matplotlib
+        fig, ax = plt.subplots(figsize=(14, 11))
+        try:
+            ax.plot(history_graph["Timestamps"], history_graph["Prices"])
+            ax.set_xlabel("Timestamps")
+            ax.set_ylabel("Prices in $")
+            ax.grid(True)
+
+            # Place the rows just above the axes
+            self._draw_text_rows(ax, extra_info, fontsize=14, linespacing=1.4)
 
-        # Convert the Matplotlib figure to HTML using mpld3
-        history_html = mpld3.fig_to_html(fig)
-        plt.close(fig)  # Close the Matplotlib figure to free up resources
+            history_html = self._figure_to_html(fig)
+        finally:
+            plt.close(fig)  # Close the Matplotlib figure to free up resources
         logging.info(
             "CoinGeckoMonteCarloSimulation successfully executed visualize_history_graph command for crypto %s.",
             self.coin_id,
         )
         return history_html
 
+    def _draw_text_rows(self, ax, rows, fontsize, linespacing=1.2) -> None:
+        """
+        Draws rows of text centered just above the axes, the last row lowest.
+
+        Static graphs use a single multi-line text artist. mpld3 renders every text
+        artist on one line, so interactive graphs get one artist per row instead.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to draw the text above.
+            rows (list): Rows of text, top to bottom.
+            fontsize (int): Font size of the text in points.
+            linespacing (float): Row height as a multiple of the font size.
+        """
+        text_kwargs = {
+            "transform": ax.transAxes,
+            "ha": "center",
+            "va": "bottom",
+            "fontsize": fontsize,
+            # Prices end in "$"; two on one text would otherwise become mathtext
+            "parse_math": False,
+        }
+        if not self.interactive:
+            ax.text(0.5, 1.02, "\n".join(rows), linespacing=linespacing, **text_kwargs)
+            return
+
+        # Row height in axes coordinates, from points via the axes height in inches
+        axes_height = ax.figure.get_figheight() * ax.get_position().height
+        row_height = fontsize * linespacing / 72 / axes_height
+        for i, row in enumerate(reversed(rows)):
+            ax.text(0.5, 1.02 + i * row_height, row, **text_kwargs)
+
+    def _figure_to_html(self, fig) -> str:
+        """
+        Converts a Matplotlib figure to an HTML fragment.
+
+        Interactive graphs are rendered with mpld3, all others as inline SVG by
+        Matplotlib's own backend.
+
+        Args:
+            fig (matplotlib.figure.Figure): The figure to convert.
+
+        Returns:
+            str: HTML representation of the figure.
+        """
+        if self.interactive:
+            return mpld3.fig_to_html(fig)
+
+        buffer = io.StringIO()
+        fig.savefig(buffer, format="svg", bbox_inches="tight")
+        svg = buffer.getvalue()
+        # Drop the XML prolog so the SVG can be inlined in the page
+        return f"<div>{svg[svg.index('<svg'):]}</div>"
+
 
 if __name__ == "__main__":
     monte_carlo = CoinGeckoMonteCarloSimulation("bitcoin", 1, 1000, 100, 5)
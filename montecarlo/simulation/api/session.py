@@ -0,0 +1,32 @@
+"""
+CoinGecko HTTP Session Module
+
+This module provides the HTTP session shared by every request made to the CoinGecko
+API, so TCP/TLS connections are reused between requests.
+
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session() -> requests.Session:
+    """
+    Creates an HTTP session that keeps CoinGecko connections alive between requests.
+
+    Returns:
+        requests.Session: Session with a connection pool and retries mounted on https.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "monte_carlo/1.0"})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared process-wide so the connection to CoinGecko is reused across requests
+SESSION = create_session()
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class SimulationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'simulation'
+
+    def ready(self):
+        from .api.monte_carlo import CoinGeckoMonteCarloSimulation
+
+        # Pay the Matplotlib backend and font initialization once at startup
+        CoinGeckoMonteCarloSimulation.warmup()
@@ -1,4 +1,6 @@
 from django import forms
+from django.conf import settings
+from .api.coin_list import get_coin_ids, start_background_refresh
 
 class MonteCarloForm(forms.Form):
     coin_id = forms.CharField(max_length=50, label='Cryptocurrency')
@@ -6,3 +8,17 @@ class MonteCarloForm(forms.Form):
     principal_amount = forms.FloatField(label='Initial Principal Amount')
     investment_horizon = forms.IntegerField(label='Investment Horizon (Years)')
     num_simulations = forms.IntegerField(label='Number of Monte Carlo Simulations')
+
+    def clean_coin_id(self):
+        coin_id = self.cleaned_data['coin_id']
+        # The coin list is loaded on first use; tests switch this off to stay offline
+        if getattr(settings, 'COIN_LIST_REFRESH', True):
+            start_background_refresh()
+        coin_ids = get_coin_ids()
+        # Only reject ids once the coin list is loaded; fail open until then
+        if coin_ids is not None and coin_id.lower() not in coin_ids:
+            raise forms.ValidationError(
+                f"Cryptocurrency '{coin_id}' is not valid! Try again ...",
+                code='unknown_coin',
+            )
+        return coin_id
@@ -1,25 +1,60 @@
 # tests.py
-from django.test import TestCase, SimpleTestCase
+from django.test import TestCase, SimpleTestCase, override_settings
 from datetime import datetime
+from unittest import skipUnless
 from unittest.mock import patch
 from django.urls import reverse
-from .api.monte_carlo import CoinGeckoMonteCarloSimulation
+from . import forms
+from .api import coin_list
+from .api import monte_carlo
+from .api.monte_carlo import CoinGeckoMonteCarloSimulation, _PRICE_CACHE
+from .api.session import SESSION
+import matplotlib.pyplot as plt
+import numpy as np
+import orjson
 import pandas as pd
+import re
+import requests
+
+
+# Valid form input shared by the view and form tests
+FORM_DATA = {
+    "coin_id": "bitcoin",
+    "years": 1,
+    "principal_amount": 1000,
+    "investment_horizon": 100,
+    "num_simulations": 5,
+}
 
 
 class CoinGeckoMonteCarloSimulationTests(TestCase):
     def setUp(self):
+        _PRICE_CACHE.clear()
         self.coin_gecko = CoinGeckoMonteCarloSimulation("bitcoin", 1, 1000, 100, 5)
 
+    def patch_price_history(self):
+        # Mock the fetch_price_data method to avoid actual API calls
+        return patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "fetch_price_data",
+            return_value=(
+                pd.date_range("2022-01-01", periods=5),
+                [100, 120, 90, 110, 80],
+            ),
+        )
+
     def test_fetch_price_data_successful_response(self):
         # Mocking a successful API response
-        with patch("requests.get") as mock_get:
+        with patch.object(SESSION, "get") as mock_get:
             mock_get.return_value.status_code = 200
-            mock_get.return_value.json.return_value = {
-                "prices": [
-                    [timestamp, price] for timestamp, price in zip(range(10), range(10))
-                ]
-            }
+            mock_get.return_value.content = orjson.dumps(
+                {
+                    "prices": [
+                        [timestamp, price]
+                        for timestamp, price in zip(range(10), range(10))
+                    ]
+                }
+            )
 
             prices = self.coin_gecko.fetch_price_data("bitcoin", 1)
 
@@ -27,7 +62,7 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
 
     def test_fetch_price_data_failed_response(self):
         # Mocking a failed API response
-        with patch("requests.get") as mock_get:
+        with patch.object(SESSION, "get") as mock_get:
             mock_get.return_value.status_code = 404
 
             coin_gecko = CoinGeckoMonteCarloSimulation(
@@ -36,6 +71,61 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
             prices = coin_gecko.fetch_price_data("Non exiting coin", 1)
 
         self.assertIsNone(prices)
+        self.assertFalse(coin_gecko.price_data_temporarily_unavailable)
+
+    def test_fetch_price_data_transient_failures(self):
+        for status_code, side_effect in (
+            (429, None),
+            (503, None),
+            (200, requests.Timeout()),
+            (200, requests.ConnectionError()),
+        ):
+            with self.subTest(status_code=status_code, side_effect=side_effect):
+                with patch.object(
+                    SESSION,
+                    "get",
+                    side_effect=side_effect,
+                ) as mock_get:
+                    mock_get.return_value.status_code = status_code
+
+                    prices = self.coin_gecko.fetch_price_data("bitcoin", 1)
+
+                self.assertIsNone(prices)
+                self.assertTrue(self.coin_gecko.price_data_temporarily_unavailable)
+
+    def test_fetch_price_data_reuses_cached_response(self):
+        with patch.object(SESSION, "get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = orjson.dumps(
+                {
+                    "prices": [
+                        [timestamp, price]
+                        for timestamp, price in zip(range(10), range(10))
+                    ]
+                }
+            )
+
+            prices = self.coin_gecko.fetch_price_data("bitcoin", 1)
+            other_instance = CoinGeckoMonteCarloSimulation("bitcoin", 1, 500, 30, 5)
+            timestamps, cached_prices = other_instance.fetch_price_data(
+                "bitcoin", 1, return_timestamps=True
+            )
+
+        mock_get.assert_called_once()
+        self.assertEqual(len(timestamps), 10)
+        self.assertEqual(list(cached_prices), list(prices))
+
+    def test_fetch_price_data_refetches_after_cache_expiry(self):
+        with patch.object(SESSION, "get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = orjson.dumps({"prices": [[0, 1], [1, 2]]})
+
+            with patch("time.monotonic", return_value=1000.0):
+                self.coin_gecko.fetch_price_data("bitcoin", 1)
+            with patch("time.monotonic", return_value=1000.0 + 301):
+                self.coin_gecko.fetch_price_data("bitcoin", 1)
+
+        self.assertEqual(mock_get.call_count, 2)
 
     def test_calculate_log_returns(self):
         # Test the calculate_log_returns method with sample data
@@ -44,10 +134,9 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
 
         log_returns = self.coin_gecko.calculate_log_returns(sample_prices)
 
+        self.assertIsInstance(log_returns, np.ndarray)
         # Round to 5 decimal places for comparison
-        log_returns = [round(val, 5) for val in log_returns]
-
-        self.assertEqual(log_returns, expected_log_returns)
+        self.assertEqual(list(np.round(log_returns, 5)), expected_log_returns)
 
     def test_monte_carlo_simulation(self):
         log_returns = pd.Series([0.02, -0.01, 0.03, -0.02])
@@ -60,17 +149,95 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
 
         self.assertEqual(len(simulations), 5)
 
-    def test_run_simulation(self):
-        # Mock the fetch_price_data method to avoid actual API calls
+    def test_monte_carlo_simulation_with_paths(self):
+        log_returns = pd.Series([0.02, -0.01, 0.03, -0.02])
+
+        simulations = self.coin_gecko.monte_carlo_simulation(
+            log_returns, 1000, 5, simulate_paths=True
+        )
+
+        self.assertEqual(len(simulations), 5)
+
+    def assert_path_simulation_matches_drift(self, investment_horizon):
+        log_returns = np.array([0.002, -0.001, 0.003, -0.002])
+        mu, sigma = log_returns.mean(), log_returns.std()
+        num_simulations = 2000
+        coin_gecko = CoinGeckoMonteCarloSimulation(
+            "bitcoin", 1, 1000, investment_horizon, num_simulations, seed=7
+        )
+
+        simulations = coin_gecko.monte_carlo_simulation(
+            log_returns, 1000, investment_horizon, simulate_paths=True
+        )
+
+        self.assertEqual(simulations.dtype, np.float64)
+        self.assertEqual(len(simulations), num_simulations)
+        standard_error = np.sqrt(investment_horizon) * sigma / np.sqrt(num_simulations)
+        self.assertAlmostEqual(
+            np.log(simulations / 1000).mean(),
+            investment_horizon * mu,
+            delta=4 * standard_error,
+        )
+
+    def test_monte_carlo_simulation_with_paths_without_numba(self):
+        # The NumPy fallback switches to float32 from _FLOAT32_MIN_HORIZON days
+        for investment_horizon in (100, 1024):
+            with self.subTest(investment_horizon=investment_horizon), patch.object(
+                monte_carlo, "_NUMBA_AVAILABLE", False
+            ):
+                self.assert_path_simulation_matches_drift(investment_horizon)
+
+    @skipUnless(monte_carlo._NUMBA_AVAILABLE, "numba is not installed")
+    def test_monte_carlo_simulation_with_paths_numba_kernel(self):
         with patch.object(
-            CoinGeckoMonteCarloSimulation,
-            "fetch_price_data",
-            return_value=[100, 120, 90, 110, 80],
-        ):
+            monte_carlo, "_mc_kernel", wraps=monte_carlo._mc_kernel
+        ) as mock_kernel:
+            self.assert_path_simulation_matches_drift(100)
+
+        mock_kernel.assert_called_once()
+
+    def test_monte_carlo_simulation_is_reproducible_with_seed(self):
+        log_returns = pd.Series([0.02, -0.01, 0.03, -0.02])
+
+        for simulate_paths in (False, True):
+            first, second = (
+                CoinGeckoMonteCarloSimulation(
+                    "bitcoin", 1, 1000, 100, 5, seed=42
+                ).monte_carlo_simulation(
+                    log_returns, 1000, 5, simulate_paths=simulate_paths
+                )
+                for _ in range(2)
+            )
+            self.assertEqual(list(first), list(second))
+
+    def test_run_simulation(self):
+        with self.patch_price_history():
             simulations = self.coin_gecko.run_simulation()
 
         self.assertEqual(len(simulations), 5)
 
+    def test_run_simulation_is_memoized(self):
+        with self.patch_price_history() as mock_fetch:
+            first = self.coin_gecko.run_simulation()
+            second = self.coin_gecko.run_simulation()
+
+        mock_fetch.assert_called_once()
+        self.assertIs(first, second)
+
+    def test_prepare_fetches_once_for_both_graphs(self):
+        with self.patch_price_history() as mock_fetch:
+            self.assertTrue(self.coin_gecko.prepare())
+            self.coin_gecko.visualize_simulation()
+            self.coin_gecko.visualize_history_graph()
+
+        mock_fetch.assert_called_once()
+
+    def test_prepare_failed_fetch(self):
+        with patch.object(
+            CoinGeckoMonteCarloSimulation, "fetch_price_data", return_value=None
+        ):
+            self.assertFalse(self.coin_gecko.prepare())
+
     def test_visualize_simulation(self):
         # Mock the run_simulation method to avoid actual simulation runs
         with patch.object(
@@ -82,6 +249,58 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
 
         self.assertTrue(isinstance(visualization_html, str))
         self.assertIn("div", visualization_html)
+        self.assertIn("<svg", visualization_html)
+
+    def test_visualize_simulation_groups_large_runs_into_buckets(self):
+        with patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "run_simulation",
+            return_value=np.linspace(900, 1100, 500),
+        ), patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "_figure_to_html",
+            side_effect=lambda fig: str(len(fig.axes[0].patches)),
+        ):
+            number_of_bars = self.coin_gecko.visualize_simulation()
+
+        self.assertEqual(number_of_bars, "50")
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_visualize_simulation_buckets_preserve_spread(self):
+        future_values = np.random.default_rng(0).lognormal(np.log(1000), 0.4, 5000)
+        with patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "run_simulation",
+            return_value=future_values,
+        ), patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "_figure_to_html",
+            side_effect=lambda fig: [bar.get_width() for bar in fig.axes[0].patches],
+        ):
+            bar_values = self.coin_gecko.visualize_simulation()
+
+        # Quantile bars reach the tails instead of collapsing onto the mean
+        self.assertEqual(bar_values, sorted(bar_values))
+        self.assertLess(bar_values[0], np.percentile(future_values, 2))
+        self.assertGreater(bar_values[-1], np.percentile(future_values, 98))
+
+    def test_visualize_simulation_interactive(self):
+        coin_gecko = CoinGeckoMonteCarloSimulation(
+            "bitcoin", 1, 1000, 100, 5, interactive=True
+        )
+        with patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "run_simulation",
+            return_value=[1100, 950, 1200, 1050, 900],
+        ):
+            visualization_html = coin_gecko.visualize_simulation()
+
+        self.assertIn("mpld3", visualization_html)
+        # mpld3 renders each text on one line, so every summary row is its own text
+        texts = re.findall(r'"text": "([^"]*)"', visualization_html)
+        self.assertIn("Cryptocurrency: Bitcoin", texts)
+        self.assertIn("Number of Simulations: 5", texts)
+        self.assertFalse(any("\\n" in text for text in texts))
 
     def test_visualize_history_graph(self):
         # Mock the fetch_price_data method to avoid actual API calls
@@ -95,7 +314,41 @@ class CoinGeckoMonteCarloSimulationTests(TestCase):
         self.assertTrue(isinstance(history_html, str))
         self.assertIn("div", history_html)
 
+    def test_visualize_history_graph_long_history_is_svg(self):
+        with patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "fetch_price_data",
+            return_value=(
+                pd.date_range("2022-01-01", periods=365),
+                np.linspace(100, 200, 365),
+            ),
+        ):
+            history_html = self.coin_gecko.visualize_history_graph()
+
+        # A single line stays smaller as SVG than as PNG even for long histories
+        self.assertIn("<svg", history_html)
+        self.assertNotIn("data:image/png", history_html)
 
+    def test_visualize_history_graph_interactive(self):
+        coin_gecko = CoinGeckoMonteCarloSimulation(
+            "bitcoin", 1, 1000, 100, 5, interactive=True
+        )
+        with patch.object(
+            CoinGeckoMonteCarloSimulation,
+            "fetch_price_data",
+            return_value=(
+                pd.date_range("2022-01-01", periods=365),
+                np.linspace(100, 200, 365),
+            ),
+        ):
+            history_html = coin_gecko.visualize_history_graph()
+
+        self.assertIn("mpld3", history_html)
+        texts = re.findall(r'"text": "([^"]*)"', history_html)
+        self.assertIn("Cryptocurrency: Bitcoin", texts)
+
+
+@override_settings(COIN_LIST_REFRESH=False)
 class MonteCarloTests(SimpleTestCase):
     def test_url_exists_at_the_correct_location(self):
         response = self.client.get("/")
@@ -108,3 +361,112 @@ class MonteCarloTests(SimpleTestCase):
     def test_template_content(self):
         response = self.client.get(reverse("montecarlo"))
         self.assertContains(response, "<title>Crypto Monte Carlo Simulation</title>")
+
+    def test_invalid_cryptocurrency_is_reported(self):
+        # Without a loaded coin list the form accepts the id and prepare() rejects it
+        with patch.object(forms, "get_coin_ids", return_value=None), patch.object(
+            CoinGeckoMonteCarloSimulation, "prepare", return_value=False
+        ):
+            response = self.client.post(
+                reverse("montecarlo"),
+                {**FORM_DATA, "coin_id": "not-a-coin"},
+                follow=True,
+            )
+
+        self.assertContains(
+            response, "Cryptocurrency &#x27;not-a-coin&#x27; is not valid!"
+        )
+
+    def test_unavailable_price_data_is_reported(self):
+        def fail_transiently(simulation):
+            simulation.price_data_temporarily_unavailable = True
+            return False
+
+        with patch.object(forms, "get_coin_ids", return_value=None), patch.object(
+            CoinGeckoMonteCarloSimulation, "prepare", fail_transiently
+        ):
+            response = self.client.post(reverse("montecarlo"), FORM_DATA, follow=True)
+
+        self.assertContains(response, "Price data is temporarily unavailable.")
+        self.assertNotContains(response, "is not valid!")
+
+
+@override_settings(COIN_LIST_REFRESH=False)
+class CoinListTests(SimpleTestCase):
+    # Mixed case, since coin ids are matched case-insensitively
+    form_data = {**FORM_DATA, "coin_id": "Bitcoin"}
+
+    def test_refresh_coin_ids(self):
+        with patch.object(coin_list, "_coin_ids", None), patch.object(
+            SESSION, "get"
+        ) as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = orjson.dumps(
+                [{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}]
+            )
+
+            self.assertTrue(coin_list.refresh_coin_ids())
+            self.assertEqual(coin_list.get_coin_ids(), frozenset({"bitcoin"}))
+
+    def test_failed_refresh_keeps_loaded_coin_ids(self):
+        with patch.object(coin_list, "_coin_ids", frozenset({"bitcoin"})), patch.object(
+            SESSION, "get"
+        ) as mock_get:
+            mock_get.return_value.status_code = 429
+
+            self.assertFalse(coin_list.refresh_coin_ids())
+            self.assertEqual(coin_list.get_coin_ids(), frozenset({"bitcoin"}))
+
+    def test_background_refresh_starts_once_per_process(self):
+        with patch.object(coin_list, "_refresh_pid", None), patch(
+            "threading.Thread"
+        ) as mock_thread, patch("os.getpid", return_value=100) as mock_getpid:
+            coin_list.start_background_refresh()
+            coin_list.start_background_refresh()
+            self.assertEqual(mock_thread.call_count, 1)
+
+            # A forked worker does not inherit the parent's thread
+            mock_getpid.return_value = 101
+            coin_list.start_background_refresh()
+            self.assertEqual(mock_thread.call_count, 2)
+
+    def test_form_does_not_start_refresh_when_disabled(self):
+        with patch.object(forms, "start_background_refresh") as mock_start:
+            forms.MonteCarloForm(self.form_data).is_valid()
+
+        mock_start.assert_not_called()
+
+    @override_settings(COIN_LIST_REFRESH=True)
+    def test_form_starts_refresh_on_first_validation(self):
+        with patch.object(forms, "start_background_refresh") as mock_start:
+            forms.MonteCarloForm(self.form_data).is_valid()
+
+        mock_start.assert_called_once()
+
+    def test_form_accepts_known_coin(self):
+        with patch.object(forms, "get_coin_ids", return_value=frozenset({"bitcoin"})):
+            self.assertTrue(forms.MonteCarloForm(self.form_data).is_valid())
+
+    def test_form_rejects_unknown_coin(self):
+        with patch.object(forms, "get_coin_ids", return_value=frozenset({"ethereum"})):
+            form = forms.MonteCarloForm(self.form_data)
+
+            self.assertFalse(form.is_valid())
+        self.assertTrue(form.has_error("coin_id", code="unknown_coin"))
+
+    def test_form_accepts_any_coin_before_list_is_loaded(self):
+        with patch.object(forms, "get_coin_ids", return_value=None):
+            self.assertTrue(forms.MonteCarloForm(self.form_data).is_valid())
+
+    def test_unknown_coin_is_rejected_without_fetching_prices(self):
+        with patch.object(
+            forms, "get_coin_ids", return_value=frozenset({"bitcoin"})
+        ), patch.object(CoinGeckoMonteCarloSimulation, "prepare") as mock_prepare:
+            response = self.client.post(
+                reverse("montecarlo"), {**self.form_data, "coin_id": "not-a-coin"}
+            )
+
+        mock_prepare.assert_not_called()
+        self.assertContains(
+            response, "Cryptocurrency &#x27;not-a-coin&#x27; is not valid!"
+        )
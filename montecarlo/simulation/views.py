@@ -19,6 +19,19 @@ def montecarlo(request):
             monte_carlo = CoinGeckoMonteCarloSimulation(
                 coin_id, years, principal_amount, investment_horizon, num_simulations
             )
+            # Fetch the price history once; both graphs are built from it
+            if not monte_carlo.prepare():
+                if monte_carlo.price_data_temporarily_unavailable:
+                    messages.error(
+                        request,
+                        "Price data is temporarily unavailable. Try again later ...",
+                    )
+                else:
+                    messages.error(
+                        request,
+                        f"Cryptocurrency '{coin_id}' is not valid! Try again ...",
+                    )
+                return redirect("montecarlo")
             try:
                 graph_html = monte_carlo.visualize_simulation()
                 history_html = monte_carlo.visualize_history_graph()
@@ -35,6 +48,8 @@ def montecarlo(request):
                 {"form": form, "graph_html": graph_html, "history_html": history_html},
             )
 
+        elif form.has_error("coin_id", code="unknown_coin"):
+            messages.error(request, form.errors["coin_id"][0])
         else:
             messages.error(request, "Fill all tabs before running simulation!")
     else: